@@ -1,9 +1,11 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables"""
 
@@ -22,12 +24,18 @@ class Settings:
 
     # Image Processing
     MAX_IMAGE_SIZE: int = 10 * 1024 * 1024  # 10MB
-    ALLOWED_EXTENSIONS: set = {"jpg", "jpeg", "png"}
+    ALLOWED_EXTENSIONS: frozenset = frozenset({"jpg", "jpeg", "png"})
     VECTOR_DIMENSION: int = 512  # ResNet50 feature dimension
 
     # Search Configuration
     DEFAULT_SEARCH_LIMIT: int = 10
-    MAX_SEARCH_LIMIT: int = 50
+    MAX_SEARCH_LIMIT: int = 100
 
 
 settings = Settings()
+
+# Module-level aliases for values read on every request
+S3_BUCKET_NAME = settings.S3_BUCKET_NAME
+MAX_IMAGE_SIZE = settings.MAX_IMAGE_SIZE
+DEFAULT_SEARCH_LIMIT = settings.DEFAULT_SEARCH_LIMIT
+MAX_SEARCH_LIMIT = settings.MAX_SEARCH_LIMIT
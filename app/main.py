@@ -1,11 +1,28 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.routers import images, search
 from app.models.schemas import HealthResponse
 from app.config import settings
+from app.services.db_service import db_service
+from app.services.image_service import image_service
+from app.services.s3_service import s3_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動時にDB・S3クライアント・Pillowを初期化し、初回リクエストの遅延を防ぐ"""
+    db_service.init_database()
+    s3_service.warmup()
+    image_service.warmup()
+    yield
+
 
 # FastAPIアプリケーションを作成
 app = FastAPI(
@@ -13,6 +30,7 @@ app = FastAPI(
     description="画像検索システム - ベクトル類似度による画像検索",
     version="0.1.0",
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # CORS設定（開発環境用）
@@ -24,6 +42,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+def _error_response(detail, status_code: int, headers=None) -> Response:
+    """エラーレスポンスをorjsonでエンコードして返す（jsonable_encoderを経由しない）"""
+    return Response(
+        content=orjson.dumps({"detail": detail}),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """HTTPExceptionのレスポンスを返す"""
+    if exc.status_code in {204, 304}:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return _error_response(exc.detail, exc.status_code, exc.headers)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """想定外の例外に対して500エラーを返す"""
+    return _error_response("Internal Server Error", 500)
+
+
 # ルーターを登録
 app.include_router(images.router)
 app.include_router(search.router)
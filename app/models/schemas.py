@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ImageMetadata(BaseModel):
@@ -19,6 +19,13 @@ class ImageUploadResponse(BaseModel):
 
 class ImageDetail(BaseModel):
     """画像詳細情報"""
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=False,
+        revalidate_instances="never",
+    )
+
     image_id: str
     image_url: str
     file_name: str
@@ -35,16 +42,21 @@ class ImageDetail(BaseModel):
 
 class SearchResponse(BaseModel):
     """文章検索のレスポンス"""
+    model_config = ConfigDict(extra="ignore", frozen=False, revalidate_instances="never")
+
     results: List[ImageDetail] = Field(default_factory=list)
     total: int = Field(..., description="結果の総数")
 
 
 class ImageListResponse(BaseModel):
     """画像一覧のレスポンス"""
+    model_config = ConfigDict(extra="ignore", frozen=False, revalidate_instances="never")
+
     images: List[ImageDetail] = Field(default_factory=list)
     total: int = Field(..., description="総画像数")
     page: int = Field(..., description="現在のページ")
     limit: int = Field(..., description="1ページあたりの件数")
+    next_cursor: Optional[str] = Field(None, description="次のページを取得するためのカーソル")
 
 
 class HealthResponse(BaseModel):
@@ -0,0 +1,23 @@
+from typing import Optional
+
+import msgspec
+
+
+class ImageDetailStruct(msgspec.Struct, kw_only=True):
+    """画像詳細情報（一覧・検索レスポンスのエンコード用）
+
+    ImageDetailと同じフィールド構成。DBから取得した値をそのまま詰め、
+    Pydanticを経由せずにJSONへエンコードする
+    """
+    image_id: str
+    image_url: str
+    file_name: str
+    file_size: int
+    mime_type: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+    tags: Optional[str] = None
+    created_at: str
+    updated_at: Optional[str] = None
@@ -1,17 +1,53 @@
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Query
-from typing import Optional
+from fastapi.responses import Response
+from typing import Annotated, Optional, Tuple
+from datetime import datetime
+import base64
+import binascii
 
-from app.models.schemas import ImageUploadResponse, ImageListResponse, ImageDetail
+import msgspec
+
+from app.models.schemas import ImageUploadResponse, ImageListResponse
+from app.models.structs import ImageDetailStruct
 from app.services.image_service import image_service
 from app.services.s3_service import s3_service
 from app.services.db_service import db_service
-from app.config import settings
+from app.config import S3_BUCKET_NAME
 
 router = APIRouter(prefix="/api", tags=["images"])
 
+# クエリパラメータ定義（モジュール読み込み時に一度だけ生成）
+PageQuery = Annotated[int, Query(ge=1, description="ページ番号")]
+ListLimit = Annotated[int, Query(ge=1, le=100, description="1ページあたりの件数")]
+
+
+def _encode_cursor(cursor: Tuple[str, str]) -> str:
+    """(created_at, image_id) をAPI用の不透明なカーソル文字列に変換"""
+    return base64.urlsafe_b64encode(msgspec.json.encode(cursor)).decode("ascii")
+
+
+def _decode_cursor(value: str) -> Tuple[str, str]:
+    """カーソル文字列を (created_at, image_id) に戻す
+
+    DBに渡す前に値も検証し、改ざんされたカーソルをクエリエラーにしない
+
+    Raises:
+        ValueError: カーソルの形式が不正な場合
+    """
+    try:
+        created_at, image_id = msgspec.json.decode(
+            base64.urlsafe_b64decode(value.encode("ascii")), type=Tuple[str, str]
+        )
+        datetime.fromisoformat(created_at)
+    except (binascii.Error, UnicodeEncodeError, msgspec.DecodeError, ValueError):
+        raise ValueError("カーソルの形式が不正です")
+    if not image_id or "\x00" in image_id:
+        raise ValueError("カーソルの形式が不正です")
+    return created_at, image_id
+
 
 @router.post("/images", response_model=ImageUploadResponse)
-async def upload_image(
+def upload_image(
     file: UploadFile = File(..., description="アップロードする画像ファイル"),
     name: str = Form(..., description="画像名（必須）"),
     description: Optional[str] = Form(None, description="画像説明"),
@@ -25,34 +61,38 @@ async def upload_image(
     - メタデータをSQLiteに保存
     """
     try:
-        # ファイルを読み込み
-        image_bytes = await file.read()
+        # ファイル全体をメモリに読み込まず、一時ファイルのまま扱う
+        image_file = file.file
         filename = file.filename or "image.jpg"
         content_type = file.content_type or "image/jpeg"
 
-        # 画像のバリデーション
-        image_service.validate_image(image_bytes, filename, content_type)
+        # ファイルサイズを取得
+        image_file.seek(0, 2)
+        file_size = image_file.tell()
+        image_file.seek(0)
 
-        # 画像のサイズを取得
-        width, height = image_service.get_image_dimensions(image_bytes)
+        # 画像のバリデーションとサイズの取得（画像は一度だけ開く）
+        payload = image_service.load_and_validate(
+            image_file, file_size, filename, content_type
+        )
 
         # S3にアップロード
         s3_key, image_url = s3_service.upload_image(
-            image_bytes,
+            payload.file_obj,
             filename,
-            content_type
+            payload.mime_type
         )
 
         # データベースに登録
         image_id = db_service.create_image(
             s3_key=s3_key,
-            s3_bucket=settings.S3_BUCKET_NAME,
+            s3_bucket=S3_BUCKET_NAME,
             file_name=filename,
-            file_size=len(image_bytes),
-            mime_type=content_type,
+            file_size=payload.file_size,
+            mime_type=payload.mime_type,
             name=name,
-            width=width,
-            height=height,
+            width=payload.width,
+            height=payload.height,
             description=description,
             tags=tags
         )
@@ -70,56 +110,68 @@ async def upload_image(
 
 
 @router.get("/images", response_model=ImageListResponse)
-async def list_images(
-    page: int = Query(1, ge=1, description="ページ番号"),
-    limit: int = Query(10, ge=1, le=100, description="1ページあたりの件数"),
-    tag: Optional[str] = Query(None, description="タグフィルター")
+def list_images(
+    page: PageQuery = 1,
+    limit: ListLimit = 10,
+    tag: Optional[str] = Query(None, description="タグフィルター"),
+    after: Optional[str] = Query(None, description="前ページのnext_cursor（指定時はpageより優先）")
 ):
     """
     画像一覧を取得
 
-    - ページネーション対応
+    - ページネーション対応（page指定、またはnext_cursorによるキーセット方式）
     - タグフィルター対応
     """
     try:
-        # 画像一覧を取得
-        images_data = db_service.list_images(page=page, limit=limit, tag_filter=tag)
-        total = db_service.count_images(tag_filter=tag)
+        # 画像一覧・総数・次ページのカーソルを取得
+        images_data, total, next_cursor = db_service.list_images_with_total(
+            page=page,
+            limit=limit,
+            tag_filter=tag,
+            after=_decode_cursor(after) if after else None
+        )
 
-        # ImageDetailに変換
-        images = []
-        for img_data in images_data:
-            # S3のURLを生成
-            image_url = s3_service.get_presigned_url(img_data['s3_key'])
+        # S3のURLをまとめて取得
+        image_urls = s3_service.get_presigned_urls([img_data['s3_key'] for img_data in images_data])
 
-            images.append(ImageDetail(
+        # DBの行はスキーマで型が保証されているため、バリデーションなしで構築
+        images = []
+        for img_data, image_url in zip(images_data, image_urls):
+            images.append(ImageDetailStruct(
                 image_id=img_data['image_id'],
                 image_url=image_url,
                 file_name=img_data['file_name'],
                 file_size=img_data['file_size'],
                 mime_type=img_data['mime_type'],
-                width=img_data.get('width'),
-                height=img_data.get('height'),
+                width=img_data['width'],
+                height=img_data['height'],
                 name=img_data['name'],
-                description=img_data.get('description'),
-                tags=img_data.get('tags'),
+                description=img_data['description'],
+                tags=img_data['tags'],
                 created_at=img_data['created_at'],
-                updated_at=img_data.get('updated_at')
+                updated_at=img_data['updated_at']
             ))
 
-        return ImageListResponse(
-            images=images,
-            total=total,
-            page=page,
-            limit=limit
+        # response_modelによる再バリデーションを避け、msgspecで直接エンコードする
+        return Response(
+            content=msgspec.json.encode({
+                "images": images,
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "next_cursor": _encode_cursor(next_cursor) if next_cursor else None,
+            }),
+            media_type="application/json",
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"画像一覧の取得に失敗しました: {str(e)}")
 
 
 @router.delete("/images/{image_id}")
-async def delete_image(image_id: str):
+def delete_image(image_id: str):
     """
     画像を削除
 
@@ -1,17 +1,27 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from fastapi.responses import Response
+from typing import Annotated, Optional
 
-from app.models.schemas import SearchResponse, ImageDetail
+import msgspec
+
+from app.models.schemas import SearchResponse
+from app.models.structs import ImageDetailStruct
 from app.services.db_service import db_service
 from app.services.s3_service import s3_service
+from app.config import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
 
 router = APIRouter(prefix="/api", tags=["search"])
 
+# クエリパラメータ定義（モジュール読み込み時に一度だけ生成）
+SearchLimit = Annotated[
+    int, Query(ge=1, le=MAX_SEARCH_LIMIT, description="返す結果の最大数")
+]
+
 
 @router.get("/search", response_model=SearchResponse)
-async def search_images(
+def search_images(
     query: str = Query(..., min_length=1, description="検索キーワード"),
-    limit: int = Query(10, ge=1, le=100, description="返す結果の最大数"),
+    limit: SearchLimit = DEFAULT_SEARCH_LIMIT,
 ):
     """
     文章検索で画像を検索
@@ -24,28 +34,32 @@ async def search_images(
         # 全文検索を実行
         search_results = db_service.search_images(query=query, limit=limit)
 
-        # ImageDetailに変換
-        results = []
-        for img_data in search_results:
-            # S3のURLを生成
-            image_url = s3_service.get_presigned_url(img_data['s3_key'])
+        # S3のURLをまとめて取得
+        image_urls = s3_service.get_presigned_urls([img_data['s3_key'] for img_data in search_results])
 
-            results.append(ImageDetail(
+        # DBの行はスキーマで型が保証されているため、バリデーションなしで構築
+        results = []
+        for img_data, image_url in zip(search_results, image_urls):
+            results.append(ImageDetailStruct(
                 image_id=img_data['image_id'],
                 image_url=image_url,
                 file_name=img_data['file_name'],
                 file_size=img_data['file_size'],
                 mime_type=img_data['mime_type'],
-                width=img_data.get('width'),
-                height=img_data.get('height'),
+                width=img_data['width'],
+                height=img_data['height'],
                 name=img_data['name'],
-                description=img_data.get('description'),
-                tags=img_data.get('tags'),
+                description=img_data['description'],
+                tags=img_data['tags'],
                 created_at=img_data['created_at'],
-                updated_at=img_data.get('updated_at')
+                updated_at=img_data['updated_at']
             ))
 
-        return SearchResponse(results=results, total=len(results))
+        # response_modelによる再バリデーションを避け、msgspecで直接エンコードする
+        return Response(
+            content=msgspec.json.encode({"results": results, "total": len(results)}),
+            media_type="application/json",
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"検索に失敗しました: {str(e)}")
@@ -5,14 +5,244 @@
 PostgreSQLまたはSQLiteに対応
 """
 
+import functools
+import threading
 import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import contextmanager
 
+from cachetools import TTLCache
+
 from app.config import settings
 
 
+# 画像詳細（ImageDetail）の構築に必要なカラム
+_IMAGE_DETAIL_COLUMN_NAMES = (
+    "image_id", "s3_key", "file_name", "file_size", "mime_type", "width", "height",
+    "name", "description", "tags", "created_at", "updated_at",
+)
+IMAGE_DETAIL_COLUMNS = ", ".join(_IMAGE_DETAIL_COLUMN_NAMES)
+# FTS5テーブルと結合する際の列名の衝突を避けるためテーブル名で修飾
+_QUALIFIED_IMAGE_DETAIL_COLUMNS = ", ".join(f"images.{col}" for col in _IMAGE_DETAIL_COLUMN_NAMES)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_fts_query(query: str) -> str:
+    """検索キーワードをFTS5のMATCH式に変換
+
+    各キーワードをダブルクォートで囲み、FTS5の演算子や記号を
+    リテラルとして扱った上で前方一致のOR検索にする
+    """
+    terms = query.strip().split()
+    return " OR ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+def _normalize_tag(tag: Optional[str]) -> Optional[str]:
+    """タグを検索用に正規化（前後の空白を除き小文字にする。空の場合はNone）"""
+    if tag is None:
+        return None
+    return tag.strip().lower() or None
+
+
+def _split_tags(tags: Optional[str]) -> List[str]:
+    """カンマ区切りのタグ文字列を正規化し、重複のないタグのリストに分割"""
+    if not tags:
+        return []
+    return list(dict.fromkeys(
+        tag for tag in (_normalize_tag(tag) for tag in tags.split(",")) if tag
+    ))
+
+
+class _StaleConnectionError(Exception):
+    """文を実行する前にPostgreSQL接続が切断済みだと分かった（新しい接続で再実行できる）"""
+
+
+def _retry_on_stale_connection(method):
+    """プールの接続が切断済みで失敗した場合、新しい接続で1度だけ再実行するデコレーター"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except _StaleConnectionError:
+            try:
+                return method(self, *args, **kwargs)
+            except _StaleConnectionError as e:
+                # 再実行でも失敗した場合は元の例外を送出
+                raise e.__cause__
+    return wrapper
+
+
+# PostgreSQLコネクションプールの最大接続数（返却された接続は保持して使い回す）
+PG_POOL_MAX_CONNECTIONS = 16
+
+# よく使うクエリ（PostgreSQLでは接続ごとに初回実行時にPREPAREし、以降はEXECUTEで実行）
+_POSTGRES_PREPARED_STATEMENTS = {
+    "get_image": f"""
+    PREPARE get_image (text) AS
+        SELECT {IMAGE_DETAIL_COLUMNS} FROM images WHERE image_id = $1;
+""",
+    "search_images": f"""
+    PREPARE search_images (text, integer) AS
+        SELECT {IMAGE_DETAIL_COLUMNS}
+        FROM images, plainto_tsquery('english', $1) AS query
+        WHERE search_tsv @@ query
+        ORDER BY ts_rank(search_tsv, query) DESC, created_at DESC
+        LIMIT $2;
+""",
+}
+
+# SQLiteは同じSQL文字列を使い回すことで接続ごとの文キャッシュを効かせる
+_SQLITE_GET_IMAGE = f"SELECT {IMAGE_DETAIL_COLUMNS} FROM images WHERE image_id = ?"
+_SQLITE_SEARCH_IMAGES = f"""
+    SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS}
+    FROM images_fts
+    JOIN images ON images.rowid = images_fts.rowid
+    WHERE images_fts MATCH ?
+    ORDER BY bm25(images_fts)
+    LIMIT ?
+"""
+
+# スキーマのバージョン（SQLiteではPRAGMA user_version、PostgreSQLではschema_versionテーブルに記録し、
+# 最新であればDDLやデータ移行を省略）
+# v3: 全文検索用のtsvector生成列、タグの正規化 / v4: idx_images_tags の削除
+SCHEMA_VERSION = 4
+
+# PostgreSQL用スキーマ
+_POSTGRES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS images (
+        image_id TEXT PRIMARY KEY,
+        s3_key TEXT NOT NULL,
+        s3_bucket TEXT NOT NULL,
+        file_name TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        mime_type TEXT NOT NULL,
+        width INTEGER,
+        height INTEGER,
+        name TEXT NOT NULL,
+        description TEXT,
+        tags TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- インデックス作成
+    -- 一覧取得（作成日時の降順）はこのインデックスのみで走査できる
+    DROP INDEX IF EXISTS idx_images_created_at;
+    CREATE INDEX IF NOT EXISTS idx_images_created_at_covering
+    ON images(created_at DESC, image_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_images_name ON images(name);
+    -- タグ検索は image_tags を使うため、tags列のインデックスは不要
+    DROP INDEX IF EXISTS idx_images_tags;
+
+    -- タグ検索用の正規化テーブル（画像削除時は連動して削除）
+    CREATE TABLE IF NOT EXISTS image_tags (
+        tag TEXT NOT NULL,
+        image_id TEXT NOT NULL REFERENCES images(image_id) ON DELETE CASCADE,
+        PRIMARY KEY (tag, image_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_image_tags_image_id ON image_tags(image_id);
+"""
+
+# PostgreSQLのスキーマのバージョン取得（最新であればDDLとデータ移行を省略）
+_POSTGRES_SCHEMA_VERSION = "SELECT coalesce(max(version), 0) AS version FROM schema_version"
+# schema_versionテーブルの作成（同時に実行すると失敗しうるため、アドバイザリーロックの取得後のみ実行）
+_POSTGRES_CREATE_SCHEMA_VERSION = "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"
+# 複数のワーカーが同時に起動した場合にスキーマ更新を直列化するアドバイザリーロックのキー
+_POSTGRES_SCHEMA_LOCK_ID = 8_245_113
+
+# PostgreSQL用のデータ移行（v3より前のスキーマからの移行時のみ実行）
+# ALTER TABLEはテーブル全体をロックし、初回は書き換えも発生するため移行が必要な場合に限る
+_POSTGRES_MIGRATION_V3 = """
+    -- 全文検索用のtsvectorを生成列として保存し、GINインデックスを作成
+    ALTER TABLE images ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english',
+            coalesce(name, '') || ' ' ||
+            coalesce(description, '') || ' ' ||
+            coalesce(tags, '')
+        )
+    ) STORED;
+    CREATE INDEX IF NOT EXISTS idx_images_search_tsv ON images USING gin(search_tsv);
+    DROP INDEX IF EXISTS idx_images_search;
+"""
+
+# PostgreSQLのスキーマのバージョン更新
+_POSTGRES_SET_SCHEMA_VERSION = """
+    DELETE FROM schema_version;
+    INSERT INTO schema_version (version) VALUES (%s);
+"""
+
+# SQLite用スキーマ
+_SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS images (
+        image_id TEXT PRIMARY KEY,
+        s3_key TEXT NOT NULL,
+        s3_bucket TEXT NOT NULL,
+        file_name TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        mime_type TEXT NOT NULL,
+        width INTEGER,
+        height INTEGER,
+        name TEXT NOT NULL,
+        description TEXT,
+        tags TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- インデックス作成
+    -- 一覧取得（作成日時の降順）はこのインデックスのみで走査できる
+    DROP INDEX IF EXISTS idx_images_created_at;
+    CREATE INDEX IF NOT EXISTS idx_images_created_at_covering
+    ON images(created_at DESC, image_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_images_name ON images(name);
+    -- タグ検索は image_tags を使うため、tags列のインデックスは不要
+    DROP INDEX IF EXISTS idx_images_tags;
+
+    -- FTS5全文検索テーブル作成
+    CREATE VIRTUAL TABLE IF NOT EXISTS images_fts USING fts5(
+        image_id UNINDEXED,
+        name,
+        description,
+        tags,
+        content='images',
+        content_rowid='rowid'
+    );
+
+    -- トリガー作成（FTS5テーブルを自動更新）
+    CREATE TRIGGER IF NOT EXISTS images_ai AFTER INSERT ON images BEGIN
+        INSERT INTO images_fts(rowid, image_id, name, description, tags)
+        VALUES (new.rowid, new.image_id, new.name, new.description, new.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS images_ad AFTER DELETE ON images BEGIN
+        INSERT INTO images_fts(images_fts, rowid, image_id, name, description, tags)
+        VALUES('delete', old.rowid, old.image_id, old.name, old.description, old.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS images_au AFTER UPDATE ON images BEGIN
+        INSERT INTO images_fts(images_fts, rowid, image_id, name, description, tags)
+        VALUES('delete', old.rowid, old.image_id, old.name, old.description, old.tags);
+        INSERT INTO images_fts(rowid, image_id, name, description, tags)
+        VALUES (new.rowid, new.image_id, new.name, new.description, new.tags);
+    END;
+
+    -- タグ検索用の正規化テーブル（tag, image_id の複合主キーで検索）
+    CREATE TABLE IF NOT EXISTS image_tags (
+        tag TEXT NOT NULL,
+        image_id TEXT NOT NULL,
+        PRIMARY KEY (tag, image_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_image_tags_image_id ON image_tags(image_id);
+
+    -- 画像削除時にタグも削除
+    CREATE TRIGGER IF NOT EXISTS images_tags_ad AFTER DELETE ON images BEGIN
+        DELETE FROM image_tags WHERE image_id = old.image_id;
+    END;
+"""
+
+
 class DatabaseService:
     """データベース操作クラス（PostgreSQL/SQLite対応）"""
 
@@ -20,152 +250,196 @@ class DatabaseService:
         self.db_url = settings.DATABASE_URL
         self.is_postgres = self.db_url.startswith("postgresql://")
 
+        # 同一クエリの検索結果を短時間キャッシュ（登録・削除のたびに世代を進めて無効化）
+        self._search_cache = TTLCache(maxsize=256, ttl=30)
+        self._search_cache_lock = threading.Lock()
+        self._data_version = 0
+
         if self.is_postgres:
             import psycopg2
-            from psycopg2.extras import RealDictCursor
+            from psycopg2.extras import execute_values
+            from app.services.pg_pool import PgConnectionPool, TrackingRealDictCursor
             self.psycopg2 = psycopg2
-            self.RealDictCursor = RealDictCursor
+            self.RealDictCursor = TrackingRealDictCursor
+            self.execute_values = execute_values
+            # 接続は初回利用時に作成され、返却後はプールに保持される
+            self._pg_pool = PgConnectionPool(self.db_url, PG_POOL_MAX_CONNECTIONS)
         else:
             import sqlite3
             self.sqlite3 = sqlite3
-
-        self._init_database()
+            self.db_path = self.db_url.replace("sqlite:///", "")
+            # スレッドごとに接続を保持して使い回す
+            self._local = threading.local()
+
+    def _invalidate_search_cache(self):
+        """検索結果キャッシュを無効化"""
+        with self._search_cache_lock:
+            self._data_version += 1
+            self._search_cache.clear()
+
+    def _execute_prepared(self, cursor, name: str, params: Tuple[Any, ...]):
+        """PREPARE済みのクエリをEXECUTEで実行
+
+        接続で初めて使うクエリは、PREPAREとEXECUTEを1回の往復でまとめて送る。
+        まとめて送った文が失敗した場合はPREPAREの成否が分からないため、
+        次回その接続で使う前に pg_prepared_statements で確認する
+        """
+        conn = cursor.connection
+        placeholders = ", ".join(["%s"] * len(params))
+        sql = f"EXECUTE {name} ({placeholders})"
+
+        if name in conn.unverified_prepares:
+            conn.unverified_prepares.discard(name)
+            cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (name,))
+            if cursor.fetchone():
+                conn.prepared.add(name)
+
+        if name in conn.prepared:
+            cursor.execute(sql, params)
+            return
+
+        try:
+            cursor.execute(_POSTGRES_PREPARED_STATEMENTS[name] + sql, params)
+        except Exception:
+            conn.unverified_prepares.add(name)
+            raise
+        conn.prepared.add(name)
+
+    def _get_sqlite_connection(self):
+        """現在のスレッド用のSQLite接続を取得（初回のみ接続を作成）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 自動トランザクションを無効化し、BEGIN/COMMITを明示的に発行する
+            conn = self.sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = self.sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
 
     @contextmanager
     def _get_connection(self):
         """データベース接続のコンテキストマネージャー"""
         if self.is_postgres:
-            # PostgreSQL接続
-            conn = self.psycopg2.connect(self.db_url)
+            # PostgreSQL接続（プールから借りて返却する）
+            conn = self._pg_pool.getconn()
+            broken = False
             try:
                 yield conn
                 conn.commit()
+            except (self.psycopg2.OperationalError, self.psycopg2.InterfaceError) as e:
+                if not (conn.closed or isinstance(e, self.psycopg2.InterfaceError)):
+                    # デッドロックやタイムアウトなど、接続が生きているエラーは通常どおりロールバック
+                    conn.rollback()
+                    raise
+                # 接続が切断されているためプールに戻さず破棄
+                broken = True
+                if not conn.executed:
+                    # 最初の文から失敗した場合はDBの再起動などで切断済みだったとみなし、
+                    # 残りのアイドル接続も破棄して新しい接続で再実行させる
+                    self._pg_pool.discard_idle()
+                    raise _StaleConnectionError() from e
+                raise
             except Exception:
                 conn.rollback()
                 raise
             finally:
-                conn.close()
+                self._pg_pool.putconn(conn, close=broken)
         else:
-            # SQLite接続
-            db_path = self.db_url.replace("sqlite:///", "")
-            conn = self.sqlite3.connect(db_path)
-            conn.row_factory = self.sqlite3.Row
+            # SQLite接続（スレッドローカルな接続を再利用）
+            conn = self._get_sqlite_connection()
+            conn.execute("BEGIN")
             try:
                 yield conn
-                conn.commit()
+                conn.execute("COMMIT")
             except Exception:
-                conn.rollback()
+                conn.execute("ROLLBACK")
                 raise
-            finally:
-                conn.close()
-
-    def _init_database(self):
-        """データベースとテーブルを初期化"""
-        if not self.is_postgres:
-            # SQLiteの場合、ディレクトリ作成
-            from pathlib import Path
-            db_path = self.db_url.replace("sqlite:///", "")
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
 
-            if self.is_postgres:
-                # PostgreSQL用テーブル作成
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS images (
-                        image_id TEXT PRIMARY KEY,
-                        s3_key TEXT NOT NULL,
-                        s3_bucket TEXT NOT NULL,
-                        file_name TEXT NOT NULL,
-                        file_size INTEGER NOT NULL,
-                        mime_type TEXT NOT NULL,
-                        width INTEGER,
-                        height INTEGER,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        tags TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-
-                # PostgreSQL用インデックス作成
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_created_at ON images(created_at)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_name ON images(name)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_tags ON images(tags)")
-
-                # PostgreSQL用全文検索インデックス
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_images_search
-                    ON images USING gin(
-                        to_tsvector('english',
-                            coalesce(name, '') || ' ' ||
-                            coalesce(description, '') || ' ' ||
-                            coalesce(tags, '')
-                        )
-                    )
-                """)
-            else:
-                # SQLite用テーブル作成
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS images (
-                        image_id TEXT PRIMARY KEY,
-                        s3_key TEXT NOT NULL,
-                        s3_bucket TEXT NOT NULL,
-                        file_name TEXT NOT NULL,
-                        file_size INTEGER NOT NULL,
-                        mime_type TEXT NOT NULL,
-                        width INTEGER,
-                        height INTEGER,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        tags TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-
-                # インデックス作成
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_created_at ON images(created_at)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_name ON images(name)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_images_tags ON images(tags)")
-
-                # FTS5全文検索テーブル作成
-                cursor.execute("""
-                    CREATE VIRTUAL TABLE IF NOT EXISTS images_fts USING fts5(
-                        image_id UNINDEXED,
-                        name,
-                        description,
-                        tags,
-                        content='images',
-                        content_rowid='rowid'
+    @_retry_on_stale_connection
+    def init_database(self):
+        """データベースとテーブルを初期化（アプリ起動時に呼び出す）"""
+        if self.is_postgres:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                # スキーマが最新であればDDLを省略（ロックを取らずに確認するためDDLは発行しない）
+                cursor.execute("SELECT to_regclass('schema_version') IS NOT NULL")
+                if cursor.fetchone()[0]:
+                    cursor.execute(_POSTGRES_SCHEMA_VERSION)
+                    if cursor.fetchone()[0] >= SCHEMA_VERSION:
+                        return
+
+                # 他のワーカーが更新中であれば完了を待ち、改めてバージョンを確認
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", (_POSTGRES_SCHEMA_LOCK_ID,))
+                cursor.execute(_POSTGRES_CREATE_SCHEMA_VERSION)
+                cursor.execute(_POSTGRES_SCHEMA_VERSION)
+                version = cursor.fetchone()[0]
+                if version >= SCHEMA_VERSION:
+                    return
+
+                # テーブル・インデックス作成と、現在のバージョンに必要なデータ移行のみを
+                # 1トランザクションで実行
+                cursor.execute(_POSTGRES_SCHEMA)
+                if version < 3:
+                    cursor.execute(_POSTGRES_MIGRATION_V3)
+                    # 既存の画像のタグを登録時と同じ方法で正規化して作り直す
+                    cursor.execute("DELETE FROM image_tags")
+                    cursor.execute("SELECT image_id, tags FROM images WHERE tags IS NOT NULL")
+                    self.execute_values(
+                        cursor,
+                        "INSERT INTO image_tags (tag, image_id) VALUES %s ON CONFLICT DO NOTHING",
+                        [
+                            (tag, image_id)
+                            for image_id, tags in cursor.fetchall()
+                            for tag in _split_tags(tags)
+                        ],
+                        page_size=1000
                     )
-                """)
-
-                # トリガー作成（FTS5テーブルを自動更新）
-                cursor.execute("""
-                    CREATE TRIGGER IF NOT EXISTS images_ai AFTER INSERT ON images BEGIN
-                        INSERT INTO images_fts(rowid, image_id, name, description, tags)
-                        VALUES (new.rowid, new.image_id, new.name, new.description, new.tags);
-                    END
-                """)
-
-                cursor.execute("""
-                    CREATE TRIGGER IF NOT EXISTS images_ad AFTER DELETE ON images BEGIN
-                        INSERT INTO images_fts(images_fts, rowid, image_id, name, description, tags)
-                        VALUES('delete', old.rowid, old.image_id, old.name, old.description, old.tags);
-                    END
-                """)
-
-                cursor.execute("""
-                    CREATE TRIGGER IF NOT EXISTS images_au AFTER UPDATE ON images BEGIN
-                        INSERT INTO images_fts(images_fts, rowid, image_id, name, description, tags)
-                        VALUES('delete', old.rowid, old.image_id, old.name, old.description, old.tags);
-                        INSERT INTO images_fts(rowid, image_id, name, description, tags)
-                        VALUES (new.rowid, new.image_id, new.name, new.description, new.tags);
-                    END
-                """)
+                cursor.execute(_POSTGRES_SET_SCHEMA_VERSION, (SCHEMA_VERSION,))
+            return
+
+        # SQLiteの場合、ディレクトリ作成
+        from pathlib import Path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # スキーマが最新であればDDLを省略
+        conn = self._get_sqlite_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        # DDL・必要なデータ移行・バージョン更新を1トランザクションで実行し、
+        # 途中で失敗した場合は次回の起動時にやり直す
+        try:
+            conn.executescript(f"BEGIN;{_SQLITE_SCHEMA}")
+            if version < 3:
+                # v3より前のスキーマから移行する場合、既存の画像のタグを正規化（小文字）して作り直す
+                conn.execute("DELETE FROM image_tags")
+                rows = conn.execute("SELECT image_id, tags FROM images WHERE tags IS NOT NULL").fetchall()
+                conn.executemany(
+                    "INSERT OR IGNORE INTO image_tags (tag, image_id) VALUES (?, ?)",
+                    [
+                        (tag, row['image_id'])
+                        for row in rows
+                        for tag in _split_tags(row['tags'])
+                    ]
+                )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+        # インデックス追加後にクエリプランナー用の統計を更新
+        conn.execute("ANALYZE")
 
     def create_image(
         self,
@@ -180,127 +454,253 @@ class DatabaseService:
         description: Optional[str] = None,
         tags: Optional[str] = None
     ) -> str:
-        """画像メタデータを登録"""
-        image_id = str(uuid.uuid4())
+        """画像メタデータを登録（一括登録処理を1件で呼び出す）"""
+        return self.create_images([{
+            's3_key': s3_key,
+            's3_bucket': s3_bucket,
+            'file_name': file_name,
+            'file_size': file_size,
+            'mime_type': mime_type,
+            'name': name,
+            'width': width,
+            'height': height,
+            'description': description,
+            'tags': tags,
+        }])[0]
+
+    @_retry_on_stale_connection
+    def create_images(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """複数の画像メタデータを1トランザクションで一括登録
+
+        Args:
+            rows: create_imageの引数と同じキーを持つ辞書のリスト
+
+        Returns:
+            登録した画像IDのリスト（rowsと同じ順序）
+        """
+        image_ids = [str(uuid.uuid4()) for _ in rows]
+        values = [
+            (
+                image_id, row['s3_key'], row['s3_bucket'], row['file_name'],
+                row['file_size'], row['mime_type'], row.get('width'), row.get('height'),
+                row['name'], row.get('description'), row.get('tags')
+            )
+            for image_id, row in zip(image_ids, rows)
+        ]
+        # タグはトリガーでは分割できないため、ここで正規化テーブル用の行を作る
+        tag_values = [
+            (tag, image_id)
+            for image_id, row in zip(image_ids, rows)
+            for tag in _split_tags(row.get('tags'))
+        ]
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
             if self.is_postgres:
-                cursor.execute("""
+                # 複数行のVALUESにまとめ、最大1000行ごとに1文で登録
+                self.execute_values(cursor, """
                     INSERT INTO images (
                         image_id, s3_key, s3_bucket, file_name, file_size, mime_type,
                         width, height, name, description, tags
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    image_id, s3_key, s3_bucket, file_name, file_size, mime_type,
-                    width, height, name, description, tags
-                ))
+                    ) VALUES %s
+                """, values, page_size=1000)
+                self.execute_values(
+                    cursor,
+                    "INSERT INTO image_tags (tag, image_id) VALUES %s ON CONFLICT DO NOTHING",
+                    tag_values,
+                    page_size=1000
+                )
             else:
-                cursor.execute("""
+                cursor.executemany("""
                     INSERT INTO images (
                         image_id, s3_key, s3_bucket, file_name, file_size, mime_type,
                         width, height, name, description, tags
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    image_id, s3_key, s3_bucket, file_name, file_size, mime_type,
-                    width, height, name, description, tags
-                ))
+                """, values)
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO image_tags (tag, image_id) VALUES (?, ?)",
+                    tag_values
+                )
 
-        return image_id
+        self._invalidate_search_cache()
+        return image_ids
 
+    @_retry_on_stale_connection
     def get_image(self, image_id: str) -> Optional[Dict[str, Any]]:
         """画像IDで画像メタデータを取得"""
         with self._get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=self.RealDictCursor)
-                cursor.execute("SELECT * FROM images WHERE image_id = %s", (image_id,))
+                self._execute_prepared(cursor, "get_image", (image_id,))
             else:
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM images WHERE image_id = ?", (image_id,))
+                cursor.execute(_SQLITE_GET_IMAGE, (image_id,))
 
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def search_images(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """全文検索で画像を検索"""
+    @_retry_on_stale_connection
+    def search_images(self, query: str, limit: int = 10) -> List[Any]:
+        """全文検索で画像を検索（同一クエリの結果は短時間キャッシュする）
+
+        行はdictに変換せず、カラム名でアクセスできる行オブジェクトのまま返す
+        """
+        if self.is_postgres:
+            search_query = query.strip()
+        else:
+            search_query = _build_fts_query(query)
+            if not search_query:
+                return []
+
+        with self._search_cache_lock:
+            cache_key = (self._data_version, search_query, limit)
+            cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=self.RealDictCursor)
                 # PostgreSQL全文検索
-                cursor.execute("""
-                    SELECT *
-                    FROM images
-                    WHERE to_tsvector('english',
-                        coalesce(name, '') || ' ' ||
-                        coalesce(description, '') || ' ' ||
-                        coalesce(tags, '')
-                    ) @@ plainto_tsquery('english', %s)
-                    ORDER BY created_at DESC
-                    LIMIT %s
-                """, (query, limit))
+                self._execute_prepared(cursor, "search_images", (search_query, limit))
             else:
                 cursor = conn.cursor()
-                # SQLite FTS5全文検索
-                search_terms = query.strip().split()
-                fts_query = " OR ".join([f"{term}*" for term in search_terms if term])
-
-                cursor.execute("""
-                    SELECT images.*
-                    FROM images
-                    JOIN images_fts ON images.rowid = images_fts.rowid
-                    WHERE images_fts MATCH ?
-                    ORDER BY rank
-                    LIMIT ?
-                """, (fts_query, limit))
+                # SQLite FTS5全文検索（bm25スコア順）
+                cursor.execute(_SQLITE_SEARCH_IMAGES, (search_query, limit))
 
             rows = cursor.fetchall()
-            return [dict(row) for row in rows]
 
-    def list_images(
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = rows
+        return rows
+
+    @_retry_on_stale_connection
+    def list_images_with_total(
         self,
         page: int = 1,
         limit: int = 10,
-        tag_filter: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """画像一覧を取得"""
+        tag_filter: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None
+    ) -> Tuple[List[Any], int, Optional[Tuple[str, str]]]:
+        """画像一覧と総数を1回のクエリで取得（行は行オブジェクトのまま返す）
+
+        after に (created_at, image_id) を指定した場合は、その行より後ろを
+        キーセット方式で取得する（page は無視される）
+
+        Returns:
+            (行のリスト, 総数, 次ページのカーソル) のタプル。
+            次ページのカーソルは最後の行の (created_at, image_id)。
+            取得件数が limit 未満の場合は None
+        """
+        tag_filter = _normalize_tag(tag_filter)
         offset = (page - 1) * limit
 
         with self._get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=self.RealDictCursor)
-                if tag_filter:
-                    cursor.execute("""
-                        SELECT * FROM images
-                        WHERE tags LIKE %s
-                        ORDER BY created_at DESC
+                if after and tag_filter:
+                    cursor.execute(f"""
+                        SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS},
+                            (SELECT COUNT(*) FROM image_tags WHERE tag = %s) AS _total
+                        FROM images
+                        JOIN image_tags ON image_tags.image_id = images.image_id
+                        WHERE image_tags.tag = %s
+                        AND (images.created_at, images.image_id) < (%s, %s)
+                        ORDER BY images.created_at DESC, images.image_id DESC
+                        LIMIT %s
+                    """, (tag_filter, tag_filter, *after, limit))
+                elif after:
+                    cursor.execute(f"""
+                        SELECT {IMAGE_DETAIL_COLUMNS}, (SELECT COUNT(*) FROM images) AS _total
+                        FROM images
+                        WHERE (created_at, image_id) < (%s, %s)
+                        ORDER BY created_at DESC, image_id DESC
+                        LIMIT %s
+                    """, (*after, limit))
+                elif tag_filter:
+                    cursor.execute(f"""
+                        SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS}, COUNT(*) OVER () AS _total FROM images
+                        JOIN image_tags ON image_tags.image_id = images.image_id
+                        WHERE image_tags.tag = %s
+                        ORDER BY images.created_at DESC, images.image_id DESC
                         LIMIT %s OFFSET %s
-                    """, (f"%{tag_filter}%", limit, offset))
+                    """, (tag_filter, limit, offset))
                 else:
-                    cursor.execute("""
-                        SELECT * FROM images
-                        ORDER BY created_at DESC
+                    cursor.execute(f"""
+                        SELECT {IMAGE_DETAIL_COLUMNS}, COUNT(*) OVER () AS _total FROM images
+                        ORDER BY created_at DESC, image_id DESC
                         LIMIT %s OFFSET %s
                     """, (limit, offset))
             else:
                 cursor = conn.cursor()
-                if tag_filter:
-                    cursor.execute("""
-                        SELECT * FROM images
-                        WHERE tags LIKE ?
-                        ORDER BY created_at DESC
-                        LIMIT ? OFFSET ?
-                    """, (f"%{tag_filter}%", limit, offset))
+                if after and tag_filter:
+                    # キーセット方式：カーソル位置からインデックスを走査
+                    cursor.execute(f"""
+                        SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS},
+                            (SELECT COUNT(*) FROM image_tags WHERE tag = ?) AS _total
+                        FROM image_tags
+                        JOIN images ON images.image_id = image_tags.image_id
+                        WHERE image_tags.tag = ?
+                        AND (images.created_at, images.image_id) < (?, ?)
+                        ORDER BY images.created_at DESC, images.image_id DESC
+                        LIMIT ?
+                    """, (tag_filter, tag_filter, *after, limit))
+                elif after:
+                    cursor.execute(f"""
+                        SELECT {IMAGE_DETAIL_COLUMNS},
+                            (SELECT COUNT(*) FROM images) AS _total
+                        FROM images
+                        WHERE (created_at, image_id) < (?, ?)
+                        ORDER BY created_at DESC, image_id DESC
+                        LIMIT ?
+                    """, (*after, limit))
+                # ページ対象のIDと総数をインデックスのみで求め、
+                # 該当ページの行だけを images から取得する
+                elif tag_filter:
+                    cursor.execute(f"""
+                        WITH page AS (
+                            SELECT images.image_id, images.created_at,
+                                COUNT(*) OVER () AS _total
+                            FROM image_tags
+                            JOIN images ON images.image_id = image_tags.image_id
+                            WHERE image_tags.tag = ?
+                            ORDER BY images.created_at DESC, images.image_id DESC
+                            LIMIT ? OFFSET ?
+                        )
+                        SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS}, page._total
+                        FROM page
+                        JOIN images ON images.image_id = page.image_id
+                        ORDER BY page.created_at DESC, page.image_id DESC
+                    """, (tag_filter, limit, offset))
                 else:
-                    cursor.execute("""
-                        SELECT * FROM images
-                        ORDER BY created_at DESC
-                        LIMIT ? OFFSET ?
+                    cursor.execute(f"""
+                        WITH page AS (
+                            SELECT image_id, created_at, COUNT(*) OVER () AS _total
+                            FROM images
+                            ORDER BY created_at DESC, image_id DESC
+                            LIMIT ? OFFSET ?
+                        )
+                        SELECT {_QUALIFIED_IMAGE_DETAIL_COLUMNS}, page._total
+                        FROM page
+                        JOIN images ON images.image_id = page.image_id
+                        ORDER BY page.created_at DESC, page.image_id DESC
                     """, (limit, offset))
 
             rows = cursor.fetchall()
-            return [dict(row) for row in rows]
 
+        if not rows:
+            # 範囲外のページでは総数が得られないため別途カウントする
+            total = self.count_images(tag_filter=tag_filter) if offset or after else 0
+            return rows, total, None
+
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = (str(last['created_at']), last['image_id'])
+        return rows, rows[0]['_total'], next_cursor
+
+    @_retry_on_stale_connection
     def delete_image(self, image_id: str) -> bool:
         """画像メタデータを削除"""
         with self._get_connection() as conn:
@@ -309,17 +709,22 @@ class DatabaseService:
                 cursor.execute("DELETE FROM images WHERE image_id = %s", (image_id,))
             else:
                 cursor.execute("DELETE FROM images WHERE image_id = ?", (image_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        self._invalidate_search_cache()
+        return deleted
 
+    @_retry_on_stale_connection
     def count_images(self, tag_filter: Optional[str] = None) -> int:
         """画像の総数を取得"""
+        tag_filter = _normalize_tag(tag_filter)
         with self._get_connection() as conn:
             if self.is_postgres:
                 cursor = conn.cursor(cursor_factory=self.RealDictCursor)
                 if tag_filter:
                     cursor.execute(
-                        "SELECT COUNT(*) as count FROM images WHERE tags LIKE %s",
-                        (f"%{tag_filter}%",)
+                        "SELECT COUNT(*) as count FROM image_tags WHERE tag = %s",
+                        (tag_filter,)
                     )
                 else:
                     cursor.execute("SELECT COUNT(*) as count FROM images")
@@ -327,8 +732,8 @@ class DatabaseService:
                 cursor = conn.cursor()
                 if tag_filter:
                     cursor.execute(
-                        "SELECT COUNT(*) as count FROM images WHERE tags LIKE ?",
-                        (f"%{tag_filter}%",)
+                        "SELECT COUNT(*) as count FROM image_tags WHERE tag = ?",
+                        (tag_filter,)
                     )
                 else:
                     cursor.execute("SELECT COUNT(*) as count FROM images")
@@ -4,32 +4,60 @@
 画像のバリデーション、リサイズ、基本情報の取得を担当
 """
 
+from dataclasses import dataclass
 from io import BytesIO
 from PIL import Image
-from typing import Tuple, Optional
+from typing import BinaryIO
+
+from app.config import MAX_IMAGE_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class ImagePayload:
+    """バリデーション済みのアップロード画像"""
+
+    file_obj: BinaryIO
+    file_size: int
+    mime_type: str
+    width: int
+    height: int
 
 
 class ImageService:
     """画像処理クラス"""
 
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    MAX_FILE_SIZE = MAX_IMAGE_SIZE  # 10MB
     ALLOWED_MIME_TYPES = {"image/jpeg", "image/png"}
     ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png"}
 
     @staticmethod
-    def validate_image(file_content: bytes, filename: str, mime_type: str) -> None:
-        """画像ファイルをバリデーション
+    def warmup() -> None:
+        """Pillowの画像フォーマットプラグインを事前に読み込む"""
+        Image.init()
+
+    @staticmethod
+    def load_and_validate(
+        file_obj: BinaryIO, file_size: int, filename: str, mime_type: str
+    ) -> ImagePayload:
+        """画像ファイルをバリデーションし、サイズなどの基本情報をまとめて取得
+
+        画像は一度だけ開き、ヘッダーから幅・高さを取得してから
+        verify() で検証する。読み込み位置は先頭に戻す
 
         Args:
-            file_content: ファイル内容
+            file_obj: ファイルオブジェクト
+            file_size: ファイルサイズ（バイト）
             filename: ファイル名
             mime_type: MIMEタイプ
 
+        Returns:
+            バリデーション済みの画像情報
+
         Raises:
             ValueError: バリデーションエラー
         """
         # ファイルサイズチェック
-        if len(file_content) > ImageService.MAX_FILE_SIZE:
+        if file_size > ImageService.MAX_FILE_SIZE:
             raise ValueError(f"ファイルサイズが大きすぎます（最大: 10MB）")
 
         # MIMEタイプチェック
@@ -43,26 +71,21 @@ class ImageService:
 
         # 実際に画像として開けるかチェック
         try:
-            image = Image.open(BytesIO(file_content))
+            image = Image.open(file_obj)
+            width, height = image.size
             image.verify()
         except Exception as e:
             raise ValueError(f"無効な画像ファイルです: {str(e)}")
-
-    @staticmethod
-    def get_image_dimensions(file_content: bytes) -> Tuple[int, int]:
-        """画像のサイズ（幅・高さ）を取得
-
-        Args:
-            file_content: ファイル内容
-
-        Returns:
-            (幅, 高さ) のタプル
-        """
-        try:
-            image = Image.open(BytesIO(file_content))
-            return image.size  # (width, height)
-        except Exception:
-            return (0, 0)
+        finally:
+            file_obj.seek(0)
+
+        return ImagePayload(
+            file_obj=file_obj,
+            file_size=file_size,
+            mime_type=mime_type,
+            width=width,
+            height=height
+        )
 
     @staticmethod
     def resize_image(
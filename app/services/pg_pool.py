@@ -0,0 +1,92 @@
+"""
+PostgreSQLコネクションプール
+
+返却された接続を保持して使い回す
+（psycopg2標準のプールは minconn を超えて返却された接続を閉じてしまうため使わない）
+"""
+
+import threading
+from typing import List
+
+import psycopg2
+from psycopg2.extensions import connection, cursor
+from psycopg2.extras import RealDictCursor
+
+
+class _ExecutedFlagMixin:
+    """文の実行に成功したことを接続に記録するカーソル"""
+
+    def execute(self, query, vars=None):
+        result = super().execute(query, vars)
+        self.connection.executed = True
+        return result
+
+
+class TrackingCursor(_ExecutedFlagMixin, cursor):
+    """通常のカーソル"""
+
+
+class TrackingRealDictCursor(_ExecutedFlagMixin, RealDictCursor):
+    """行をdictで返すカーソル"""
+
+
+class PooledConnection(connection):
+    """プールで使い回す接続"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursor_factory = TrackingCursor
+        # この接続でPREPARE済みのクエリ名
+        self.prepared = set()
+        # PREPAREを送ったが成否を確認できていないクエリ名
+        self.unverified_prepares = set()
+        # 現在の貸し出し中に文を1つでも実行したか
+        self.executed = False
+
+
+class PgConnectionPool:
+    """接続数の上限つきで、返却された接続を保持して使い回すプール"""
+
+    def __init__(self, dsn: str, max_connections: int):
+        self.dsn = dsn
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        # 上限に達したときはエラーにせず、接続が返却されるまで待つ
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def getconn(self) -> PooledConnection:
+        """接続を借りる（アイドル接続がなければ新規に接続）"""
+        self._slots.acquire()
+        try:
+            conn = None
+            with self._lock:
+                while self._idle and conn is None:
+                    conn = self._idle.pop()
+                    if conn.closed:
+                        conn = None
+            if conn is None:
+                conn = psycopg2.connect(self.dsn, connection_factory=PooledConnection)
+        except Exception:
+            self._slots.release()
+            raise
+
+        conn.executed = False
+        return conn
+
+    def putconn(self, conn: PooledConnection, close: bool = False) -> None:
+        """接続を返却（close=True または切断済みの場合は破棄）"""
+        try:
+            if close or conn.closed:
+                conn.close()
+            else:
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    def discard_idle(self) -> None:
+        """アイドル接続をすべて破棄（DBの再起動などで切断済みの可能性がある場合）"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
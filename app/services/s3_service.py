@@ -1,9 +1,41 @@
+import threading
+
 import boto3
-from botocore.exceptions import ClientError
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from datetime import datetime
-from typing import Tuple
+from io import BytesIO
+from typing import BinaryIO, List, Tuple, Union
+from cachetools import TLRUCache
 from app.config import settings
 
+# 署名付きURLのデフォルト有効期限（秒）
+PRESIGNED_URL_EXPIRATION = 3600
+# 期限切れ間際のURLを返さないよう、キャッシュは有効期限よりこの秒数だけ早く破棄する
+PRESIGNED_URL_CACHE_MARGIN = 600
+# キャッシュの最大保持秒数
+# 署名付きURLは署名した一時認証情報（インスタンスロール）の失効とともに無効になる。
+# botocoreは失効の10分前までに認証情報を必ず更新するため、保持期間をそれより短くして
+# 失効間際の認証情報で署名したURLを失効後に返さないようにする
+PRESIGNED_URL_CACHE_MAX_AGE = 300
+
+
+def _url_cache_ttu(key: Tuple[str, int], url: str, now: float) -> float:
+    """キャッシュエントリの破棄時刻（URLの有効期限 - マージン と 最大保持秒数 の早い方）"""
+    return now + min(key[1] - PRESIGNED_URL_CACHE_MARGIN, PRESIGNED_URL_CACHE_MAX_AGE)
+
+
+# マルチパートアップロードの設定（8MBを超える画像は並列に分割転送する）
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 class S3Service:
     """AWS S3操作サービス"""
@@ -13,17 +45,28 @@ class S3Service:
         self.s3_client = boto3.client(
             "s3",
             region_name=settings.AWS_REGION,
+            config=Config(
+                signature_version="s3v4",
+                retries={"mode": "adaptive"},
+                tcp_keepalive=True,
+                max_pool_connections=50,
+            ),
         )
         self.bucket_name = settings.S3_BUCKET_NAME
+        # (S3キー, 有効期限) -> 署名付きURL のキャッシュ
+        self._url_cache = TLRUCache(maxsize=10_000, ttu=_url_cache_ttu)
+        self._url_cache_lock = threading.Lock()
 
     def upload_image(
-        self, image_bytes: bytes, filename: str, content_type: str
+        self, image: Union[bytes, BinaryIO], filename: str, content_type: str
     ) -> Tuple[str, str]:
         """
         画像をS3にアップロード
 
+        ファイルオブジェクトを渡した場合は全体をメモリに読み込まずに転送する
+
         Args:
-            image_bytes: 画像データ（バイト形式）
+            image: 画像データ（バイト形式またはファイルオブジェクト）
             filename: 元のファイル名
             content_type: 画像のMIMEタイプ（例: image/jpeg）
 
@@ -39,11 +82,13 @@ class S3Service:
             s3_key = f"images/{timestamp}_{filename}"
 
             # S3にアップロード
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=image_bytes,
-                ContentType=content_type,
+            fileobj = BytesIO(image) if isinstance(image, bytes) else image
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=TRANSFER_CONFIG,
             )
 
             # 画像URLを生成（署名付きURL）
@@ -51,9 +96,21 @@ class S3Service:
 
             return s3_key, image_url
 
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             raise Exception(f"S3アップロードに失敗しました: {str(e)}")
 
+    def warmup(self) -> None:
+        """署名処理を事前に初期化（ネットワーク通信は発生しない）"""
+        try:
+            self.s3_client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket_name, "Key": "warmup"},
+                ExpiresIn=60,
+            )
+        except (BotoCoreError, ClientError):
+            # 認証情報が未設定の環境でもアプリの起動は継続する
+            pass
+
     def delete_image(self, s3_key: str) -> None:
         """
         S3から画像を削除
@@ -66,14 +123,22 @@ class S3Service:
         """
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            # 一覧・アップロードで使うデフォルト有効期限のURLのみ破棄する
+            # （個別の有効期限のURLはキャッシュ期限まで残るが、削除済みのオブジェクトを指すだけ）
+            with self._url_cache_lock:
+                self._url_cache.pop((s3_key, PRESIGNED_URL_EXPIRATION), None)
 
         except ClientError as e:
             raise Exception(f"S3削除に失敗しました: {str(e)}")
 
-    def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> str:
+    def get_presigned_url(
+        self, s3_key: str, expiration: int = PRESIGNED_URL_EXPIRATION
+    ) -> str:
         """
         署名付きURLを生成（一時的なアクセス用）
 
+        同じキー・有効期限で生成済みのURLがあれば再利用する
+
         Args:
             s3_key: S3オブジェクトキー
             expiration: URL有効期限（秒）
@@ -84,6 +149,15 @@ class S3Service:
         Raises:
             Exception: URL生成に失敗した場合
         """
+        # マージン以下の短い有効期限はキャッシュしない
+        cache_key = (s3_key, expiration)
+        use_cache = expiration > PRESIGNED_URL_CACHE_MARGIN
+        if use_cache:
+            with self._url_cache_lock:
+                url = self._url_cache.get(cache_key)
+            if url is not None:
+                return url
+
         try:
             url = self.s3_client.generate_presigned_url(
                 "get_object",
@@ -91,11 +165,53 @@ class S3Service:
                 ExpiresIn=expiration,
             )
 
-            return url
+        except ClientError as e:
+            raise Exception(f"署名付きURL生成に失敗しました: {str(e)}")
+
+        if use_cache:
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = url
+        return url
+
+    def get_presigned_urls(self, s3_keys: List[str]) -> List[str]:
+        """
+        複数のS3キーに対する署名付きURLをまとめて取得
+
+        Args:
+            s3_keys: S3オブジェクトキーのリスト
+
+        Returns:
+            s3_keysと同じ順序の署名付きURLのリスト
+        """
+        with self._url_cache_lock:
+            urls = [
+                self._url_cache.get((s3_key, PRESIGNED_URL_EXPIRATION))
+                for s3_key in s3_keys
+            ]
+
+        missing = [i for i, url in enumerate(urls) if url is None]
+        if not missing:
+            return urls
+
+        # キャッシュにないキーのみ、同じパラメータ辞書を使い回して署名
+        params = {"Bucket": self.bucket_name, "Key": ""}
+        try:
+            for i in missing:
+                params["Key"] = s3_keys[i]
+                urls[i] = self.s3_client.generate_presigned_url(
+                    "get_object",
+                    Params=params,
+                    ExpiresIn=PRESIGNED_URL_EXPIRATION,
+                )
 
         except ClientError as e:
             raise Exception(f"署名付きURL生成に失敗しました: {str(e)}")
 
+        with self._url_cache_lock:
+            for i in missing:
+                self._url_cache[(s3_keys[i], PRESIGNED_URL_EXPIRATION)] = urls[i]
+        return urls
+
 
 # グローバルインスタンス
 s3_service = S3Service()
@@ -0,0 +1,41 @@
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import images as images_router
+from app.routers import search as search_router
+from app.services import db_service as db_module
+from app.services.db_service import DatabaseService
+from app.services.s3_service import s3_service
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """一時ファイルのSQLiteを使うDatabaseService"""
+    monkeypatch.setattr(
+        db_module,
+        "settings",
+        dataclasses.replace(db_module.settings, DATABASE_URL=f"sqlite:///{tmp_path}/images.db"),
+    )
+    service = DatabaseService()
+    service.init_database()
+    monkeypatch.setattr(images_router, "db_service", service)
+    monkeypatch.setattr(search_router, "db_service", service)
+    return service
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """S3へのアクセスを差し替えたテストクライアント（lifespanは実行しない）"""
+    monkeypatch.setattr(
+        s3_service, "upload_image",
+        lambda image, filename, content_type: (f"images/{filename}", f"https://example.com/{filename}"),
+    )
+    monkeypatch.setattr(
+        s3_service, "get_presigned_urls",
+        lambda s3_keys: [f"https://example.com/{key}" for key in s3_keys],
+    )
+    monkeypatch.setattr(s3_service, "delete_image", lambda s3_key: None)
+    return TestClient(app)
@@ -0,0 +1,17 @@
+def make_rows(count, tags=None):
+    """create_images に渡すテスト用の行を作成"""
+    return [
+        {
+            "s3_key": f"images/{i}.png",
+            "s3_bucket": "test-bucket",
+            "file_name": f"{i}.png",
+            "file_size": 100,
+            "mime_type": "image/png",
+            "name": f"image {i}",
+            "width": 10,
+            "height": 10,
+            "description": "test",
+            "tags": tags,
+        }
+        for i in range(count)
+    ]
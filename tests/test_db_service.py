@@ -0,0 +1,77 @@
+import pytest
+
+from app.services import db_service as db_module
+from app.services.db_service import SCHEMA_VERSION, DatabaseService
+
+from tests.helpers import make_rows
+
+
+def _image_tags(db):
+    with db._get_connection() as conn:
+        return sorted(tuple(row) for row in conn.execute("SELECT tag, image_id FROM image_tags"))
+
+
+def test_tags_are_normalized_on_insert(db):
+    [image_id] = db.create_images(make_rows(1, tags=" Pet, CAT ,cat,, "))
+
+    assert _image_tags(db) == [("cat", image_id), ("pet", image_id)]
+
+
+def test_schema_upgrade_rebuilds_normalized_tags(db):
+    [image_id] = db.create_images(make_rows(1, tags="Pet, Cat"))
+    # 旧バージョンで大文字のまま登録されたタグを再現
+    with db._get_connection() as conn:
+        conn.execute("DELETE FROM image_tags")
+        conn.execute("INSERT INTO image_tags (tag, image_id) VALUES ('Cat', ?)", (image_id,))
+    db._get_sqlite_connection().execute("PRAGMA user_version = 2")
+
+    upgraded = DatabaseService()
+    upgraded.init_database()
+
+    assert _image_tags(upgraded) == [("cat", image_id), ("pet", image_id)]
+    assert upgraded.count_images(tag_filter="Cat") == 1
+
+
+def test_failed_tag_rebuild_is_retried_on_next_start(db, monkeypatch):
+    [image_id] = db.create_images(make_rows(1, tags="cat,pet"))
+    with db._get_connection() as conn:
+        conn.execute("DELETE FROM image_tags")
+    db._get_sqlite_connection().execute("PRAGMA user_version = 2")
+
+    def fail(tags):
+        raise RuntimeError("backfill failed")
+
+    with monkeypatch.context() as m:
+        m.setattr(db_module, "_split_tags", fail)
+        with pytest.raises(RuntimeError):
+            DatabaseService().init_database()
+
+    restarted = DatabaseService()
+    assert restarted._get_sqlite_connection().execute("PRAGMA user_version").fetchone()[0] == 2
+    restarted.init_database()
+
+    assert _image_tags(restarted) == [("cat", image_id), ("pet", image_id)]
+    assert restarted.count_images(tag_filter="cat") == 1
+
+
+def test_schema_upgrade_from_v3_keeps_existing_tags(db):
+    [image_id] = db.create_images(make_rows(1, tags="cat"))
+    with db._get_connection() as conn:
+        conn.execute("INSERT INTO image_tags (tag, image_id) VALUES ('kept', ?)", (image_id,))
+    db._get_sqlite_connection().execute("PRAGMA user_version = 3")
+
+    upgraded = DatabaseService()
+    upgraded.init_database()
+
+    assert _image_tags(upgraded) == [("cat", image_id), ("kept", image_id)]
+    assert upgraded._get_sqlite_connection().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_search_cache_is_invalidated_on_create_and_delete(db):
+    assert db.search_images("sunset") == []
+
+    [image_id] = db.create_images([{**make_rows(1)[0], "name": "sunset"}])
+    assert [row["image_id"] for row in db.search_images("sunset")] == [image_id]
+
+    assert db.delete_image(image_id)
+    assert db.search_images("sunset") == []
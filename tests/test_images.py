@@ -0,0 +1,108 @@
+import base64
+import io
+
+import pytest
+from PIL import Image
+
+from tests.helpers import make_rows
+
+
+def _page_through(client, **params):
+    """next_cursor をたどって全ページの画像IDを取得"""
+    seen = []
+    response = client.get("/api/images", params=params).json()
+    while True:
+        seen += [image["image_id"] for image in response["images"]]
+        if not response["next_cursor"]:
+            return seen, response
+        response = client.get(
+            "/api/images", params={**params, "after": response["next_cursor"]}
+        ).json()
+
+
+def _set_created_at(db, image_ids, created_at):
+    with db._get_connection() as conn:
+        conn.executemany(
+            "UPDATE images SET created_at = ? WHERE image_id = ?",
+            [(created_at, image_id) for image_id in image_ids],
+        )
+
+
+def _cursor(value):
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def test_keyset_pagination_returns_every_row_once(client, db):
+    ids = db.create_images(make_rows(8))
+    # 作成日時が同じ行をまたいでページが切り替わるようにする
+    _set_created_at(db, ids[:3], "2026-01-01 00:00:00")
+    _set_created_at(db, ids[3:], "2026-01-02 00:00:00")
+
+    seen, last = _page_through(client, limit=3)
+
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(ids)
+    assert last["total"] == 8
+
+
+def test_keyset_pagination_matches_offset_order(client, db):
+    ids = db.create_images(make_rows(6))
+    _set_created_at(db, ids, "2026-01-01 00:00:00")
+
+    seen, _ = _page_through(client, limit=2)
+    by_offset = [
+        image["image_id"]
+        for page in (1, 2, 3)
+        for image in client.get("/api/images", params={"limit": 2, "page": page}).json()["images"]
+    ]
+
+    assert seen == by_offset
+
+
+def test_keyset_pagination_with_tag_filter(client, db):
+    tagged = db.create_images(make_rows(5, tags="cat, pet"))
+    db.create_images(make_rows(3, tags="dog"))
+
+    seen, last = _page_through(client, limit=2, tag="cat")
+
+    assert sorted(seen) == sorted(tagged)
+    assert last["total"] == 5
+
+
+@pytest.mark.parametrize("after", [
+    "not base64!",
+    _cursor("not json"),
+    _cursor('["2026-01-01 00:00:00"]'),
+    _cursor("[1, 2]"),
+    _cursor('["abc", "x"]'),
+    _cursor('["2026-01-01 00:00:00", ""]'),
+])
+def test_malformed_cursor_returns_400(client, db, after):
+    response = client.get("/api/images", params={"after": after})
+
+    assert response.status_code == 400
+
+
+def test_tag_filter_is_case_insensitive_exact_match(client, db):
+    db.create_images(make_rows(2, tags="Pet, Cat"))
+    db.create_images(make_rows(1, tags="category"))
+
+    assert client.get("/api/images", params={"tag": "cat"}).json()["total"] == 2
+    assert client.get("/api/images", params={"tag": "CAT"}).json()["total"] == 2
+    assert client.get("/api/images", params={"tag": "ca"}).json()["total"] == 0
+
+
+def test_upload_image(client, db):
+    buffer = io.BytesIO()
+    Image.new("RGB", (30, 20)).save(buffer, "PNG")
+
+    response = client.post(
+        "/api/images",
+        files={"file": ("photo.png", buffer.getvalue(), "image/png")},
+        data={"name": "photo", "tags": "Cat"},
+    )
+
+    assert response.status_code == 200
+    image = db.get_image(response.json()["image_id"])
+    assert (image["width"], image["height"]) == (30, 20)
+    assert db.count_images(tag_filter="cat") == 1
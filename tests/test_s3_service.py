@@ -0,0 +1,77 @@
+import pytest
+from cachetools import TLRUCache
+
+from app.services import s3_service as s3_module
+from app.services.s3_service import (
+    PRESIGNED_URL_CACHE_MAX_AGE,
+    PRESIGNED_URL_EXPIRATION,
+    S3Service,
+)
+
+
+class FakeS3Client:
+    """署名したキーを記録し、呼び出し回数ごとに異なるURLを返す"""
+
+    def __init__(self):
+        self.signed = []
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.signed.append(Params["Key"])
+        return f"https://example.com/{Params['Key']}?sig={len(self.signed)}"
+
+    def delete_object(self, Bucket, Key):
+        pass
+
+
+@pytest.fixture
+def clock():
+    return [1000.0]
+
+
+@pytest.fixture
+def s3(clock):
+    service = S3Service()
+    service.s3_client = FakeS3Client()
+    # 時刻を進められるよう、同じ設定のキャッシュをテスト用のタイマーで作り直す
+    service._url_cache = TLRUCache(
+        maxsize=100, ttu=s3_module._url_cache_ttu, timer=lambda: clock[0]
+    )
+    return service
+
+
+def test_url_cache_ttu_stays_below_credential_refresh_window():
+    now = 1000.0
+
+    assert s3_module._url_cache_ttu(("a", PRESIGNED_URL_EXPIRATION), "url", now) == now + PRESIGNED_URL_CACHE_MAX_AGE
+    # botocoreが認証情報を必ず更新する失効10分前より短く保持する
+    assert PRESIGNED_URL_CACHE_MAX_AGE < 600
+
+
+def test_presigned_urls_are_served_from_cache(s3):
+    first = s3.get_presigned_urls(["a", "b"])
+    second = s3.get_presigned_urls(["b", "a", "c"])
+
+    assert second == [first[1], first[0], "https://example.com/c?sig=3"]
+    assert s3.s3_client.signed == ["a", "b", "c"]
+    assert s3.get_presigned_url("a") == first[0]
+
+
+def test_presigned_urls_are_signed_again_after_max_age(s3, clock):
+    [first] = s3.get_presigned_urls(["a"])
+
+    clock[0] += PRESIGNED_URL_CACHE_MAX_AGE - 1
+    assert s3.get_presigned_urls(["a"]) == [first]
+
+    clock[0] += 1
+    [second] = s3.get_presigned_urls(["a"])
+    assert second != first
+    assert s3.s3_client.signed == ["a", "a"]
+
+
+def test_delete_image_evicts_cached_url(s3):
+    [first] = s3.get_presigned_urls(["a"])
+
+    s3.delete_image("a")
+
+    assert s3.get_presigned_urls(["a"]) != [first]
+    assert s3.s3_client.signed == ["a", "a"]